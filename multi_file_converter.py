@@ -1,114 +1,493 @@
+import argparse
+import importlib.util
 import pandas as pd
 import numpy as np
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 
-def convert_stock_file_to_long(file_path, output_suffix="", value_column_name="Value"):
+def _read_wide_excel(file_path, header=0, numeric=False):
+    """
+    Read the first sheet of a wide format Excel file into a DataFrame
+
+    Uses pandas' calamine engine (the Rust based parser) when python-calamine
+    is installed and pandas supports it (2.2+), which streams the sheet instead
+    of building an openpyxl XML tree. Falls back to pandas' default Excel
+    engine otherwise. Going through
+    read_excel either way keeps pandas' header handling: blank headers become
+    "Unnamed: n", numeric headers stay numbers and repeated ones get a ".1" suffix.
+
+    Parameters:
+    - file_path: Path to the Excel file
+    - header: Row number (0-indexed) holding the column names
+    - numeric: Whether all stock columns hold numbers, so pandas' reader can parse
+      them straight to float64 ('-' and blanks as NaN, commas as thousands separators)
+    """
+    # pandas only knows the calamine engine from 2.2 on
+    pandas_version = tuple(int(part) for part in pd.__version__.split('.')[:2])
+    if pandas_version >= (2, 2) and importlib.util.find_spec("python_calamine") is not None:
+        engine = "calamine"
+    else:
+        engine = None
+
+    # Either engine returns '-' and comma separated numbers as text,
+    # so numeric sheets get the float parsing hints with both
+    if numeric:
+        columns = pd.read_excel(file_path, header=header, nrows=0, engine=engine).columns
+        try:
+            return pd.read_excel(
+                file_path,
+                header=header,
+                engine=engine,
+                dtype={col: 'float64' for col in columns[1:]},
+                na_values=['-', ''],
+                thousands=','
+            )
+        except ValueError:
+            pass  # Some cell is not a number, read the sheet as-is and clean it afterwards
+    return pd.read_excel(file_path, header=header, engine=engine)
+
+def _write_csv(df, csv_file, header=True):
+    """
+    Save a DataFrame as CSV without the index
+
+    Uses pyarrow's multi-threaded C++ CSV writer when pyarrow is installed,
+    otherwise (or for mixed-type object columns arrow cannot type) DataFrame.to_csv.
+
+    Parameters:
+    - df: DataFrame to save
+    - csv_file: Output filename, or a file opened in binary mode to append to
+    - header: Whether to write the header row
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        from pyarrow import csv as pacsv
+    except ImportError:
+        df.to_csv(csv_file, header=header, index=False)
+        return
+
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except pa.ArrowException:
+        df.to_csv(csv_file, header=header, index=False)
+        return
+
+    # Write timestamps without a time of day as plain dates, like pandas does
+    for i, field in enumerate(table.schema):
+        if pa.types.is_timestamp(field.type):
+            column = table.column(i)
+            if pc.all(pc.equal(pc.floor_temporal(column, unit='day'), column)).as_py() is not False:
+                table = table.set_column(i, field.name, column.cast(pa.date32()))
+    pacsv.write_csv(table, csv_file, write_options=pacsv.WriteOptions(include_header=header))
+
+def _write_long_chunks(chunks, output_filename, output_format="csv"):
+    """
+    Write long format frames one after another into a single CSV or Parquet file
+
+    Each chunk is yielded back once it is written, so the caller can report on
+    it without keeping the whole long format frame in memory. Empty chunks are
+    skipped (unless nothing else was written) so they cannot fix the file schema.
+    """
+    if output_format == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+    parquet_writer = None
+    last_chunk = None
+    written = False
+    with open(output_filename, 'wb') as fh:
+        try:
+            for chunk in chunks:
+                last_chunk = chunk
+                if chunk.empty:
+                    continue
+                if output_format == "parquet":
+                    table = pa.Table.from_pandas(chunk, preserve_index=False)
+                    if parquet_writer is None:
+                        parquet_writer = pq.ParquetWriter(fh, table.schema, compression='snappy')
+                    parquet_writer.write_table(table.cast(parquet_writer.schema))
+                else:
+                    _write_csv(chunk, fh, header=not written)
+                written = True
+                yield chunk
+
+            if not written and last_chunk is not None:
+                if output_format == "parquet":
+                    last_chunk.to_parquet(fh, engine='pyarrow', compression='snappy', index=False)
+                else:
+                    _write_csv(last_chunk, fh)
+                yield last_chunk
+        finally:
+            if parquet_writer is not None:
+                parquet_writer.close()
+
+def _parse_dates(dates, date_format=None):
+    """
+    Parse a column of dates/periods (e.g. "2020/03") to datetime64
+
+    Done once on the wide frame, so the long format Date column holds 8-byte
+    timestamps instead of Python objects. Without a date_format only date and
+    datetime cells are converted, text is never guessed at (pandas would read
+    ROC dates like "109/01/02" as the year 109). The column is returned
+    unchanged if it holds numbers, if any entry does not parse (e.g. a leftover
+    header row) or if a year falls outside 1900-2100.
+    """
+    if pd.api.types.is_datetime64_any_dtype(dates) or pd.api.types.is_numeric_dtype(dates):
+        return dates
+    if date_format is None and pd.api.types.infer_dtype(dates, skipna=True) not in ('date', 'datetime'):
+        return dates
+    parsed = pd.to_datetime(dates, format=date_format, errors='coerce')
+    if parsed.isna().sum() > dates.isna().sum():
+        return dates
+    years = parsed.dt.year
+    if ((years < 1900) | (years > 2100)).any():
+        return dates
+    return parsed
+
+def _parse_numbers(values):
+    """
+    Parse a 1-D object array of numbers and number text to numbers, NaN where
+    a cell does not parse
+
+    Commas (from numbers like "63,292,145") are stripped from the text cells
+    only, numbers and dates pass through as-is.
+    """
+    is_text = np.fromiter((isinstance(value, str) for value in values), bool, len(values))
+    if is_text.any():
+        values_stripped = values.copy()
+        values_stripped[is_text] = pd.Series(values[is_text]).str.replace(',', '', regex=False).to_numpy(dtype=object)
+    else:
+        values_stripped = values
+    return pd.to_numeric(values_stripped, errors='coerce')
+
+def _clean_value_column(values, numeric=None):
+    """
+    Drop empty cells from a flat array of long format values and clean numeric data
+
+    Parameters:
+    - values: 1-D numpy array of values
+    - numeric: True to always convert to numbers, False to never convert,
+      None to convert only when most values are numeric
+
+    Returns a boolean mask of the cells that were kept and the cleaned values for them.
+    """
+    # Remove missing values with one combined mask
+    keep = ~pd.isna(values)
+    if values.dtype == object:
+        keep &= (values != '-') & (values != '')
+    values = values[keep]
+    if numeric is False or values.dtype != object:
+        return keep, values
+
+    # Clean numeric data (remove commas from numbers like "63,292,145")
+    numeric_values = _parse_numbers(values)
+    parsed = ~pd.isna(numeric_values)
+
+    # Without an explicit choice, only convert if most values are numeric
+    if numeric or parsed.sum() > len(parsed) * 0.8:
+        keep[keep] = parsed
+        return keep, numeric_values[parsed]
+    return keep, values
+
+def _mostly_numeric(df, step):
+    """
+    Whether over 80% of the non-empty stock cells of a wide frame are numbers
+
+    The rule _clean_value_column applies to one block of values, counted over
+    all stock columns step columns at a time so memory stays bounded. Blocks
+    of dates (or anything else that is not a number) count as text.
+    """
+    kept = parsed = 0
+    for start in range(0, len(df.columns) - 1, step):
+        values = df.iloc[:, 1 + start:1 + start + step].to_numpy().ravel(order='F')
+        _, values = _clean_value_column(values, False)
+        kept += len(values)
+        if values.dtype.kind in 'biuf':
+            parsed += len(values)
+        elif values.dtype == object:
+            parsed += int((~pd.isna(_parse_numbers(values))).sum())
+    return parsed > kept * 0.8
+
+def _iter_long_chunks(df, value_column_name, numeric=None, chunk_size=None):
+    """
+    Turn a wide frame (first column dates, one column per stock) into cleaned
+    long format frames with Date, Stock and value columns, chunk_size stock
+    columns at a time (all of them at once when chunk_size is None)
+
+    Rows come out one stock after another like pandas melt, but are built by
+    repeating the date/stock labels instead of melting row by row. Empty cells
+    are masked out of the flat numpy arrays so each frame is constructed once.
+    """
+    date_col = df.columns[0]
+    dates = df[date_col].to_numpy()
+    n_dates = len(dates)
+
+    # Stock is categorical: one small integer code per row instead of a string.
+    # All chunks share the categories of the full stock list so they line up.
+    # Names are kept as text, so a numeric header (e.g. 2330) does not mix category types.
+    stocks = pd.Categorical([str(stock) for stock in df.columns[1:]])
+    n_stocks = len(stocks)
+    step = chunk_size or max(n_stocks, 1)
+
+    # Settle numeric vs text over the whole frame so every chunk has the same type
+    if numeric is None and chunk_size:
+        numeric = _mostly_numeric(df, step)
+
+    for start in range(0, max(n_stocks, 1), step):
+        block = df.iloc[:, 1 + start:1 + start + step].to_numpy()
+        keep, values = _clean_value_column(block.ravel(order='F'), numeric)
+        if numeric and chunk_size and values.dtype.kind in 'biuf':
+            values = values.astype(np.float64, copy=False)
+
+        codes = np.repeat(stocks.codes[start:start + block.shape[1]], n_dates)
+        yield pd.DataFrame({
+            'Date': np.tile(dates, block.shape[1])[keep],
+            'Stock': pd.Categorical.from_codes(codes[keep], dtype=stocks.dtype),
+            value_column_name: values
+        })
+
+def _unpivot_wide(df, value_column_name, numeric=None):
+    """
+    Turn a wide frame (first column dates, one column per stock) into one
+    cleaned long format frame with Date, Stock and value columns
+    """
+    return next(_iter_long_chunks(df, value_column_name, numeric))
+
+def convert_stock_file_to_long(file_path, output_suffix="", value_column_name="Value", output_format="csv",
+                               chunk_size=None, verbose=False, numeric=None, date_format=None):
     """
     Convert any stock data file from wide to long format
     
+    Nothing is printed here (so parallel workers do not interleave on stdout);
+    pass the returned stats to print_conversion_summary to show the report.
+    
     Parameters:
     - file_path: Path to the Excel file
     - output_suffix: Suffix to add to output filename (e.g., "_prices", "_volume")
     - value_column_name: Name for the value column (e.g., "Price", "Volume", "MarketCap")
-    """
+    - output_format: "csv" (default) or "parquet" (snappy compressed, needs pyarrow)
+    - chunk_size: Convert and write this many stock columns at a time to bound memory
+      (e.g., 256). The long format frame is then not kept and None is returned for it.
+    - verbose: Gather summary statistics and a data sample (each is a full pass over the data)
+    - numeric: True if the values are all numbers (prices, volumes), False if they are text,
+      None to decide from the data
+    - date_format: strftime format of the date/period column (e.g., "%Y/%m"), None to infer
     
-    print(f"📊 Converting {file_path}...")
+    Returns the long format frame, the output filename and a dict of conversion stats.
+    """
+    if output_format not in ("csv", "parquet"):
+        raise ValueError(f"output_format must be 'csv' or 'parquet', not {output_format!r}")
     
     # Read the Excel file
-    print("📂 Reading Excel file...")
-    df = pd.read_excel(file_path)
+    df = _read_wide_excel(file_path, numeric=bool(numeric))
     
     # Get column names
     date_col = df.columns[0]  # First column is date/period
     stock_cols = df.columns[1:]  # All other columns are stocks
+    df[date_col] = _parse_dates(df[date_col], date_format)
     
-    print(f"📈 Found {len(df)} rows × {len(stock_cols)} stocks")
-    print(f"📅 Period range: {df[date_col].min()} to {df[date_col].max()}")
-    
-    # Convert to long format using pandas melt
-    print("🔄 Converting to long format...")
-    long_df = df.melt(
-        id_vars=[date_col],
-        value_vars=stock_cols,
-        var_name='Stock',
-        value_name=value_column_name
-    )
-    
-    # Rename date column to English
-    long_df = long_df.rename(columns={date_col: 'Date'})
-    
-    # Clean the data
-    print("🧹 Cleaning data...")
-    initial_rows = len(long_df)
-    
-    # Remove rows with missing values
-    long_df = long_df.dropna(subset=[value_column_name])
-    long_df = long_df[long_df[value_column_name] != '-']
-    long_df = long_df[long_df[value_column_name] != '']
+    # Generate output filename
+    base_name = os.path.splitext(os.path.basename(file_path))[0]
+    output_filename = f"{base_name}{output_suffix}_long_format.{output_format}"
     
-    # Clean numeric data (remove commas from numbers like "63,292,145")
-    if long_df[value_column_name].dtype == 'object':
-        # Try to clean and convert to numeric
-        long_df[value_column_name] = long_df[value_column_name].astype(str).str.replace(',', '')
-        # Try to convert to numeric, keeping original if conversion fails
-        numeric_values = pd.to_numeric(long_df[value_column_name], errors='coerce')
-        # Only replace if we successfully converted most values
-        if numeric_values.notna().sum() > len(numeric_values) * 0.8:
-            long_df[value_column_name] = numeric_values
-            long_df = long_df.dropna(subset=[value_column_name])
+    stats = {
+        "file": file_path,
+        "output_file": output_filename,
+        "output_format": output_format,
+        "value_name": value_column_name,
+        "periods": len(df),
+        "stocks": len(stock_cols),
+        "chunk_size": chunk_size
+    }
+    if verbose:
+        stats["period_range"] = (df[date_col].min(), df[date_col].max())
     
-    # Reset index
-    long_df = long_df.reset_index(drop=True)
+    if chunk_size:
+        # Stream groups of stock columns straight to disk, one chunk in memory at a time
+        long_df = None
+        final_rows = 0
+        sample = None
+        chunks = _iter_long_chunks(df, value_column_name, numeric, chunk_size)
+        for chunk in _write_long_chunks(chunks, output_filename, output_format):
+            final_rows += len(chunk)
+            if sample is None:
+                sample = chunk.head(5)
+        
+        if verbose:
+            stats["sample"] = sample.to_string(index=False)
+    else:
+        # Convert to long format and clean the data
+        long_df = _unpivot_wide(df, value_column_name, numeric)
+        final_rows = len(long_df)
+        
+        # Save as CSV or Parquet
+        if output_format == "parquet":
+            long_df.to_parquet(output_filename, engine='pyarrow', compression='snappy', index=False)
+        else:
+            _write_csv(long_df, output_filename)
+        
+        if verbose:
+            # Gather all summary statistics in one agg call instead of a scan per number
+            is_numeric = pd.api.types.is_numeric_dtype(long_df[value_column_name])
+            aggregations = {'Stock': ['nunique'], 'Date': ['nunique', 'min', 'max']}
+            if is_numeric:
+                aggregations[value_column_name] = ['min', 'max', 'mean', 'median']
+            summary = long_df.agg(aggregations)
+            
+            stats["unique_stocks"] = int(summary.loc['nunique', 'Stock'])
+            stats["unique_dates"] = int(summary.loc['nunique', 'Date'])
+            stats["date_range"] = (summary.loc['min', 'Date'], summary.loc['max', 'Date'])
+            stats["sample"] = long_df.head(5).to_string(index=False)
+            if is_numeric:
+                stats["value_stats"] = {
+                    name: float(summary.loc[name, value_column_name])
+                    for name in ['min', 'max', 'mean', 'median']
+                }
     
-    final_rows = len(long_df)
-    removed_rows = initial_rows - final_rows
+    stats["rows"] = final_rows
+    stats["removed_rows"] = len(df) * len(stock_cols) - final_rows
     
-    print(f"🗑️  Removed {removed_rows:,} empty/invalid rows")
-    print(f"✅ Conversion complete! {final_rows:,} data points created")
+    try:
+        stats["file_size_mb"] = os.path.getsize(output_filename) / (1024 * 1024)
+    except OSError:
+        stats["file_size_mb"] = None
     
-    # Generate output filename
-    base_name = os.path.splitext(os.path.basename(file_path))[0]
-    csv_filename = f"{base_name}{output_suffix}_long_format.csv"
+    return long_df, output_filename, stats
+
+def print_conversion_summary(stats):
+    """
+    Print the report for one conversion from the stats returned by
+    convert_stock_file_to_long
+    """
+    print(f"📊 Converted {stats['file']}")
+    print(f"📈 Found {stats['periods']} rows × {stats['stocks']} stocks")
+    if "period_range" in stats:
+        print(f"📅 Period range: {stats['period_range'][0]} to {stats['period_range'][1]}")
+    if stats["chunk_size"]:
+        print(f"🔄 Converted in chunks of {stats['chunk_size']} stocks")
     
-    # Save as CSV
-    print(f"💾 Saving to {csv_filename}...")
-    long_df.to_csv(csv_filename, index=False)
-    print(f"✅ CSV file saved successfully!")
+    print(f"🗑️  Removed {stats['removed_rows']:,} empty/invalid rows")
+    print(f"✅ Conversion complete! {stats['rows']:,} data points created")
+    print(f"💾 Saved {stats['output_format'].upper()} file: {stats['output_file']}")
     
     # Show summary statistics
-    print(f"\n📊 Dataset Summary:")
-    print(f"   Total data points: {len(long_df):,}")
-    print(f"   Unique stocks: {long_df['Stock'].nunique():,}")
-    print(f"   Unique dates/periods: {long_df['Date'].nunique():,}")
-    print(f"   Date range: {long_df['Date'].min()} to {long_df['Date'].max()}")
+    if "unique_stocks" in stats:
+        print(f"\n📊 Dataset Summary:")
+        print(f"   Total data points: {stats['rows']:,}")
+        print(f"   Unique stocks: {stats['unique_stocks']:,}")
+        print(f"   Unique dates/periods: {stats['unique_dates']:,}")
+        print(f"   Date range: {stats['date_range'][0]} to {stats['date_range'][1]}")
     
     # Show sample data
-    print(f"\n📋 Sample of converted data:")
-    print(long_df.head(5).to_string(index=False))
+    if "sample" in stats:
+        print(f"\n📋 Sample of converted data:")
+        print(stats["sample"])
     
     # Show value statistics if numeric
-    if pd.api.types.is_numeric_dtype(long_df[value_column_name]):
-        print(f"\n📈 {value_column_name} Statistics:")
-        print(f"   Min: {long_df[value_column_name].min():,.2f}")
-        print(f"   Max: {long_df[value_column_name].max():,.2f}")
-        print(f"   Mean: {long_df[value_column_name].mean():,.2f}")
-        print(f"   Median: {long_df[value_column_name].median():,.2f}")
+    if "value_stats" in stats:
+        print(f"\n📈 {stats['value_name']} Statistics:")
+        print(f"   Min: {stats['value_stats']['min']:,.2f}")
+        print(f"   Max: {stats['value_stats']['max']:,.2f}")
+        print(f"   Mean: {stats['value_stats']['mean']:,.2f}")
+        print(f"   Median: {stats['value_stats']['median']:,.2f}")
     
     # Show file size
-    try:
-        file_size = os.path.getsize(csv_filename)
-        file_size_mb = file_size / (1024 * 1024)
-        print(f"\n📁 File size: {file_size_mb:.1f} MB")
-    except:
-        pass
-    
-    return long_df, csv_filename
+    if stats["file_size_mb"] is not None:
+        print(f"\n📁 File size: {stats['file_size_mb']:.1f} MB")
+
+def _convert_for_batch(*args, **kwargs):
+    """
+    Process pool worker for convert_all_stock_files: converts one file and
+    returns only the output filename and stats, not the long format frame
+    """
+    _, output_filename, stats = convert_stock_file_to_long(*args, **kwargs)
+    return output_filename, stats
+
+def _polars_long_plan(df, value_column_name):
+    """
+    Lazy Polars plan that unpivots a wide frame (first column dates, one column
+    per stock) into Date, Stock and value columns, with empty cells removed
+    """
+    import polars as pl
+
+    date_col = df.columns[0]  # First column is date/period
+    value = pl.col(value_column_name)
 
-def convert_all_stock_files():
+    # Stock columns can come back as a mix of String and Float64, so unpivot them as text
+    return (
+        df.lazy()
+        .with_columns(pl.exclude(date_col).cast(pl.Utf8))
+        .unpivot(index=[date_col], variable_name='Stock', value_name=value_column_name)
+        .filter(value.is_not_null() & (value != '-') & (value != ''))
+        .rename({date_col: 'Date'})
+    )
+
+def convert_stock_file_to_long_polars(file_path, output_suffix="", value_column_name="Value", numeric=None,
+                                      sample_rows=1000):
+    """
+    Convert a stock data file from wide to long format using Polars
+
+    Unpivot, cleaning and the CSV write run as one lazy, multi-threaded Polars
+    plan that streams to disk. Requires the optional polars package.
+
+    The rows match convert_stock_file_to_long, but the output is not
+    byte-identical: blank headers are named by polars ("__UNNAMED__1" rather
+    than "Unnamed: 1"), dates are written as they are read (no _parse_dates),
+    Stock is plain text and floats/quoting follow polars' CSV writer.
+
+    Parameters:
+    - file_path: Path to the Excel file
+    - output_suffix: Suffix to add to output filename (e.g., "_prices", "_volume")
+    - value_column_name: Name for the value column (e.g., "Price", "Volume", "MarketCap")
+    - numeric: True/False to force numeric or text values, None to decide from the
+      first sample_rows rows of the sheet (numeric if over 80% of them convert)
+    - sample_rows: Number of sheet rows used to decide numeric when it is None
+
+    Returns the CSV filename.
+    """
+    import polars as pl
+
+    print(f"📊 Converting {file_path} (polars)...")
+
+    # Read the Excel file
+    print("📂 Reading Excel file...")
+    df = pl.read_excel(file_path)
+    print(f"📈 Found {df.height} rows × {df.width - 1} stocks")
+
+    lf = _polars_long_plan(df, value_column_name)
+
+    # Clean numeric data (remove commas), only if most values convert.
+    # The share is taken from a small sample so the full plan only runs once.
+    numeric_value = pl.col(value_column_name).str.replace_all(',', '', literal=True).cast(pl.Float64, strict=False)
+    if numeric is None:
+        sample = _polars_long_plan(df.head(sample_rows), value_column_name)
+        converted_share = sample.select(numeric_value.is_not_null().mean()).collect().item()
+        numeric = converted_share is not None and converted_share > 0.8
+    if numeric:
+        lf = lf.with_columns(numeric_value).drop_nulls(value_column_name)
+
+    # Generate output filename
+    base_name = os.path.splitext(os.path.basename(file_path))[0]
+    csv_filename = f"{base_name}{output_suffix}_long_format.csv"
+
+    # Save as CSV, streaming the plan to disk without materialising the long frame
+    print(f"💾 Saving to {csv_filename}...")
+    lf.sink_csv(csv_filename)
+    print("✅ CSV file saved successfully!")
+
+    return csv_filename
+
+def convert_all_stock_files(output_format="csv", verbose=False):
     """
     Convert all stock data files to long format
+    
+    Parameters:
+    - output_format: "csv" (default) or "parquet"
+    - verbose: Print summary statistics for every converted file
     """
+    if output_format not in ("csv", "parquet"):
+        raise ValueError(f"output_format must be 'csv' or 'parquet', not {output_format!r}")
     
     # Define files and their configurations
     files_config = [
@@ -116,30 +495,35 @@ def convert_all_stock_files():
             "file": "stock price.xlsx",
             "suffix": "_prices", 
             "value_name": "Price",
+            "numeric": True,
             "description": "Stock Prices"
         },
         {
             "file": "tv.xlsx",
             "suffix": "_volume", 
             "value_name": "Volume",
+            "numeric": True,
             "description": "Trading Volume"
         },
         {
             "file": "mkt cap.xlsx",
             "suffix": "_market_cap", 
             "value_name": "MarketCap",
+            "numeric": True,
             "description": "Market Capitalization"
         },
         {
             "file": "book value.xlsx",
             "suffix": "_book_value", 
             "value_name": "BookValue",
+            "date_format": "%Y/%m",
             "description": "Book Value (Quarterly)"
         },
         {
             "file": "announcemnet date.xlsx",  # Note: keeping original spelling
             "suffix": "_announcement", 
             "value_name": "AnnouncementDate",
+            "date_format": "%Y/%m",
             "description": "Announcement Dates"
         }
     ]
@@ -147,48 +531,76 @@ def convert_all_stock_files():
     print("🚀 Starting batch conversion of all stock data files...")
     print("="*60)
     
-    results = []
+    results = [None] * len(files_config)
+    pending = []
     
-    for config in files_config:
-        try:
-            if os.path.exists(config["file"]):
-                print(f"\n📁 Processing: {config['description']}")
-                print("-" * 40)
-                
-                df, filename = convert_stock_file_to_long(
-                    config["file"], 
-                    config["suffix"], 
-                    config["value_name"]
-                )
-                
-                results.append({
-                    "original_file": config["file"],
-                    "output_file": filename,
-                    "description": config["description"],
-                    "rows": len(df),
-                    "success": True
-                })
-                
-            else:
-                print(f"⚠️  File not found: {config['file']}")
-                results.append({
-                    "original_file": config["file"],
-                    "output_file": None,
-                    "description": config["description"],
-                    "rows": 0,
-                    "success": False
-                })
-                
-        except Exception as e:
-            print(f"❌ Error processing {config['file']}: {e}")
-            results.append({
+    # One directory listing instead of a stat call per file
+    existing_files = {entry.name for entry in os.scandir('.') if entry.is_file()}
+    
+    for index, config in enumerate(files_config):
+        if config["file"] in existing_files:
+            pending.append(index)
+        else:
+            print(f"⚠️  File not found: {config['file']}")
+            results[index] = {
                 "original_file": config["file"],
                 "output_file": None,
                 "description": config["description"],
                 "rows": 0,
-                "success": False,
-                "error": str(e)
-            })
+                "success": False
+            }
+    
+    # The files are independent, so convert them in parallel (one process per file)
+    if pending:
+        max_workers = min(len(pending), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    _convert_for_batch,
+                    files_config[index]["file"],
+                    files_config[index]["suffix"],
+                    files_config[index]["value_name"],
+                    output_format,
+                    verbose=verbose,
+                    numeric=files_config[index].get("numeric"),
+                    date_format=files_config[index].get("date_format")
+                ): index
+                for index in pending
+            }
+            
+            for future in as_completed(futures):
+                index = futures[future]
+                config = files_config[index]
+                try:
+                    filename, stats = future.result()
+                    results[index] = {
+                        "original_file": config["file"],
+                        "output_file": filename,
+                        "description": config["description"],
+                        "rows": stats["rows"],
+                        "success": True,
+                        "stats": stats
+                    }
+                    
+                except Exception as e:
+                    results[index] = {
+                        "original_file": config["file"],
+                        "output_file": None,
+                        "description": config["description"],
+                        "rows": 0,
+                        "success": False,
+                        "error": str(e)
+                    }
+    
+    # Per-file reports, printed here in order once all workers are done
+    for index in pending:
+        result = results[index]
+        print(f"\n📁 Processing: {result['description']}")
+        print("-" * 40)
+        if result["success"]:
+            print_conversion_summary(result["stats"])
+        else:
+            print(f"❌ Error processing {result['original_file']}: {result['error']}")
     
     # Summary report
     print("\n" + "="*60)
@@ -218,14 +630,25 @@ def convert_all_stock_files():
     return results
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert Taiwan stock data files from wide to long format")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv",
+                        help="output file format (default: csv)")
+    parser.add_argument("--verbose", action="store_true", help="print summary statistics for each file")
+    args = parser.parse_args()
+    
     print("🔄 Taiwan Stock Data Multi-File Converter")
     print("=" * 50)
     
     # Option 1: Convert all files at once
-    convert_all_stock_files()
+    convert_all_stock_files(output_format=args.format, verbose=args.verbose)
     
-    # Option 2: Convert individual files (uncomment as needed)
-    # convert_stock_file_to_long("tv.xlsx", "_volume", "Volume")
+    # Option 2: Convert individual files (uncomment as needed),
+    # then print_conversion_summary(stats) to show the report
+    # long_df, filename, stats = convert_stock_file_to_long("tv.xlsx", "_volume", "Volume")
     # convert_stock_file_to_long("mkt cap.xlsx", "_market_cap", "MarketCap")
     # convert_stock_file_to_long("book value.xlsx", "_book_value", "BookValue")
-    # convert_stock_file_to_long("announcemnet date.xlsx", "_announcement", "AnnouncementDate")
\ No newline at end of file
+    # convert_stock_file_to_long("announcemnet date.xlsx", "_announcement", "AnnouncementDate")
+    # convert_stock_file_to_long("stock price.xlsx", "_prices", "Price", chunk_size=256)  # bounded memory
+
+    # Option 3: Polars pipeline for very large files (requires polars)
+    # convert_stock_file_to_long_polars("stock price.xlsx", "_prices", "Price")
\ No newline at end of file
@@ -1,5 +1,44 @@
 import pandas as pd
 import numpy as np
+from multi_file_converter import _parse_dates, _read_wide_excel, _unpivot_wide, _write_csv
+
+def _fix_quarterly(path, value_name, out_csv, numeric=False):
+    """
+    Convert one quarterly Excel file (real column names on row 2) to long format
+    
+    Parameters:
+    - path: Path to the Excel file
+    - value_name: Name for the value column (e.g., "BookValue")
+    - out_csv: Output CSV filename
+    - numeric: Whether to clean the values into numbers
+    """
+    # The issue: first row contains headers, second row contains actual column names
+    # Let the reader take the column names from row 2 (index 1) and the data from row 3 on
+    data_rows = _read_wide_excel(path, header=1, numeric=numeric)  # Columns should be ['年/月', '1101 台泥', '1102 亞泥', ...]
+    
+    # Periods are year/month strings like "2020/03"
+    date_col = data_rows.columns[0]
+    data_rows[date_col] = _parse_dates(data_rows[date_col], '%Y/%m')
+    
+    print(f"Found {len(data_rows)} periods and {len(data_rows.columns)-1} stocks")
+    
+    # Convert to long format and clean
+    long_df = _unpivot_wide(data_rows, value_name, numeric)
+    
+    # Save fixed file
+    _write_csv(long_df, out_csv)
+    print(f"✅ Fixed {value_name}: {len(long_df):,} rows saved to {out_csv}")
+    print("Sample data:")
+    print(long_df.head(3))
+    
+    # Show some statistics
+    if numeric:
+        print(f"\n📊 {value_name} Statistics:")
+        print(f"   Min: {long_df[value_name].min():,.0f}")
+        print(f"   Max: {long_df[value_name].max():,.0f}")
+        print(f"   Mean: {long_df[value_name].mean():,.0f}")
+    
+    return long_df
 
 def fix_quarterly_data_files():
     """
@@ -11,97 +50,27 @@ def fix_quarterly_data_files():
     # Fix announcement dates
     print("\n📅 Fixing announcement dates file...")
     try:
-        # Read the original Excel file properly
-        df_announce = pd.read_excel("announcemnet date.xlsx")
-        
-        # The issue: first row contains headers, second row contains actual column names
-        # Let's fix this properly
-        
-        # Get the actual column names from row 2 (index 1)
-        actual_columns = df_announce.iloc[0].values  # This should be ['年/月', '1101 台泥', '1102 亞泥', ...]
-        
-        # Get the data starting from row 3 (index 2)
-        data_rows = df_announce.iloc[1:].reset_index(drop=True)
-        data_rows.columns = actual_columns
-        
-        print(f"Found {len(data_rows)} periods and {len(actual_columns)-1} stocks")
-        
-        # Now convert to long format properly
-        date_col = actual_columns[0]  # Should be '年/月'
-        stock_cols = actual_columns[1:]
-        
-        long_df = data_rows.melt(
-            id_vars=[date_col],
-            value_vars=stock_cols,
-            var_name='Stock',
-            value_name='AnnouncementDate'
-        )
-        
-        # Rename and clean
-        long_df = long_df.rename(columns={date_col: 'Date'})
-        long_df = long_df.dropna(subset=['AnnouncementDate'])
-        long_df = long_df[long_df['AnnouncementDate'] != '-']
-        long_df = long_df[long_df['AnnouncementDate'] != '']
-        
-        # Save fixed file
-        long_df.to_csv("announcement_dates_fixed.csv", index=False)
-        print(f"✅ Fixed announcement dates: {len(long_df):,} rows saved")
-        print("Sample data:")
-        print(long_df.head(3))
-        
+        _fix_quarterly("announcemnet date.xlsx", "AnnouncementDate", "announcement_dates_fixed.csv")
     except Exception as e:
         print(f"❌ Error fixing announcement dates: {e}")
     
     # Fix book values
     print("\n💰 Fixing book values file...")
     try:
-        # Read the original Excel file properly
-        df_book = pd.read_excel("book value.xlsx")
-        
-        # Same fix as above
-        actual_columns = df_book.iloc[0].values
-        data_rows = df_book.iloc[1:].reset_index(drop=True)
-        data_rows.columns = actual_columns
-        
-        print(f"Found {len(data_rows)} periods and {len(actual_columns)-1} stocks")
-        
-        # Convert to long format
-        date_col = actual_columns[0]
-        stock_cols = actual_columns[1:]
-        
-        long_df = data_rows.melt(
-            id_vars=[date_col],
-            value_vars=stock_cols,
-            var_name='Stock',
-            value_name='BookValue'
-        )
-        
-        # Rename and clean
-        long_df = long_df.rename(columns={date_col: 'Date'})
-        long_df = long_df.dropna(subset=['BookValue'])
-        long_df = long_df[long_df['BookValue'] != '-']
-        long_df = long_df[long_df['BookValue'] != '']
-        
-        # Clean numeric values (remove commas)
-        long_df['BookValue'] = long_df['BookValue'].astype(str).str.replace(',', '')
-        long_df['BookValue'] = pd.to_numeric(long_df['BookValue'], errors='coerce')
-        long_df = long_df.dropna(subset=['BookValue'])
-        
-        # Save fixed file
-        long_df.to_csv("book_values_fixed.csv", index=False)
-        print(f"✅ Fixed book values: {len(long_df):,} rows saved")
-        print("Sample data:")
-        print(long_df.head(3))
-        
-        # Show some statistics
-        print(f"\n📊 Book Value Statistics:")
-        print(f"   Min: {long_df['BookValue'].min():,.0f}")
-        print(f"   Max: {long_df['BookValue'].max():,.0f}")
-        print(f"   Mean: {long_df['BookValue'].mean():,.0f}")
-        
+        _fix_quarterly("book value.xlsx", "BookValue", "book_values_fixed.csv", numeric=True)
     except Exception as e:
         print(f"❌ Error fixing book values: {e}")
 
+def _csv_columns(filename):
+    """
+    Column names of a CSV file, read from its first block only
+    """
+    try:
+        from pyarrow import csv as pacsv
+    except ImportError:
+        return list(pd.read_csv(filename, nrows=0).columns)
+    return pacsv.open_csv(filename).schema.names
+
 def verify_daily_files():
     """
     Quick verification that daily files (TV, Market Cap) converted correctly
@@ -115,14 +84,16 @@ def verify_daily_files():
     
     for filename in files_to_check:
         try:
-            df = pd.read_csv(filename)
+            columns = _csv_columns(filename)
+            # Only the key columns are needed for the counts, skip loading the values
+            df = pd.read_csv(filename, usecols=['Date', 'Stock'], dtype={'Stock': 'category'})
             print(f"\n📊 {filename}:")
             print(f"   Rows: {len(df):,}")
-            print(f"   Columns: {list(df.columns)}")
+            print(f"   Columns: {columns}")
             print(f"   Unique dates: {df['Date'].nunique()}")
             print(f"   Unique stocks: {df['Stock'].nunique()}")
             print("   Sample:")
-            print(df.head(2))
+            print(pd.read_csv(filename, nrows=2))
             
         except FileNotFoundError:
             print(f"❌ File not found: {filename}")
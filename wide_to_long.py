@@ -84,7 +84,7 @@ def quick_analysis(csv_file="taiwan_stocks_long_format.csv"):
     Quick analysis of the converted CSV data
     """
     print("🔍 Loading CSV for quick analysis...")
-    df = pd.read_csv(csv_file)
+    df = pd.read_csv(csv_file, dtype={'Stock': 'category'})
     
     print(f"\n📊 Quick Analysis:")
     print(f"   Dataset shape: {df.shape}")